@@ -10,22 +10,46 @@
 
 # Bu yazılım, "olduğu gibi" sağlanmaktadır ve herhangi bir garanti verilmemektedir.
 
-from dataclasses import dataclass
-from typing import List, Dict, Optional
-from itertools import combinations, product
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Tuple
 import re
 
-@dataclass
+DAY_IDX = {"Pazartesi": 0, "Salı": 1, "Çarşamba": 2, "Perşembe": 3, "Cuma": 4, "Cumartesi": 5, "Pazar": 6}
+DAYS_SET = frozenset(DAY_IDX)
+# parse_schedule files rows under any non-tab line it sees, so labels that are
+# not weekdays get their own index and still only clash with each other.
+_EXTRA_DAY_IDX: Dict[Optional[str], int] = {}
+_CODE_RE = re.compile(r"([A-Z]+ \d+)\((\d+)\)")
+
+def _to_minutes(hhmm: str) -> int:
+    hours, minutes = hhmm.split(':')
+    return int(hours) * 60 + int(minutes)
+
+def _day_index(day: Optional[str]) -> int:
+    if day in DAY_IDX:
+        return DAY_IDX[day]
+    return _EXTRA_DAY_IDX.setdefault(day, len(DAY_IDX) + len(_EXTRA_DAY_IDX))
+
 class TimeSlot:
-    start_time: str
-    end_time: str
+    __slots__ = ('start_time', 'end_time', 'start_min', 'end_min')
+
+    def __init__(self, start_time: str, end_time: str):
+        self.start_time = start_time
+        self.end_time = end_time
+        self.start_min = _to_minutes(start_time)
+        self.end_min = _to_minutes(end_time)
+
+    def __repr__(self):
+        return f"TimeSlot(start_time={self.start_time!r}, end_time={self.end_time!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, TimeSlot):
+            return NotImplemented
+        return (self.start_time, self.end_time) == (other.start_time, other.end_time)
     
     def __str__(self):
         return f"{self.start_time}-{self.end_time}"
-    
-    
-    def overlaps(self, other: 'TimeSlot') -> bool:
-        return not (self.end_time <= other.start_time or other.end_time <= self.start_time)
+
 
 @dataclass
 class Course:
@@ -35,39 +59,70 @@ class Course:
     classroom: str
     instructor: str
     time_slots: Dict[str, List[TimeSlot]]
+    _intervals: Optional[Tuple[Tuple[int, int, int], ...]] = field(default=None, init=False, repr=False, compare=False)
     
     def add_time_slot(self, day: str, time_slot: TimeSlot):
         if day not in self.time_slots:
             self.time_slots[day] = []
         self.time_slots[day].append(time_slot)
-        self.time_slots[day].sort(key=lambda x: x.start_time)
+        self._intervals = None
+
+    @property
+    def intervals(self) -> Tuple[Tuple[int, int, int], ...]:
+        if self._intervals is None:
+            self._finalize()
+        return self._intervals
+
+    def _finalize(self):
+        for slots in self.time_slots.values():
+            slots.sort(key=lambda x: x.start_min)
+        self._intervals = tuple(sorted(
+            (_day_index(day), slot.start_min, slot.end_min)
+            for day, slots in self.time_slots.items()
+            for slot in slots
+        ))
     def __hash__(self):
         return hash((self.code, self.section))
     
-    def overlaps_with(self, other: 'Course') -> bool:
-        for day, slots in self.time_slots.items():
-            if day in other.time_slots:
-                for slot1 in slots:
-                    for slot2 in other.time_slots[day]:
-                        if slot1.overlaps(slot2):
-                            return True
-        return False
-    
     def __str__(self):
         return f"{self.code} {self.name} (Şube: {self.section})"
 
+def _overlapping_pairs(rows: List[Tuple[int, int, int, int]]):
+    # rows are (day, start, end, owner_id) sorted by (day, start); yields the
+    # owner ids of every pair of rows whose time ranges overlap on the same day.
+    active = []
+    current_day = None
+    for day, start, end, owner in rows:
+        if day != current_day:
+            current_day = day
+            active = []
+        else:
+            active = [row for row in active if row[1] > start]
+        for other_start, other_end, other in active:
+            if start < other_end and other_start < end:
+                yield other, owner
+        active.append((start, end, owner))
+
 class Schedule:
     def __init__(self, courses: List[Course]):
         self.courses = courses
         self.days_order = ["Pazartesi", "Salı", "Çarşamba", "Perşembe", "Cuma"]
+        self._intervals: Optional[List[Tuple[int, int, int, int]]] = None
+        self._daily_cache: Optional[Dict[str, List[tuple[str, TimeSlot]]]] = None
     
     def is_valid(self) -> bool:
-        for c1, c2 in combinations(self.courses, 2):
-            if c1.overlaps_with(c2):
-                return False
-        return True
+        if self._intervals is None:
+            self._intervals = sorted(
+                (day, start, end, course_id)
+                for course_id, course in enumerate(self.courses)
+                for day, start, end in course.intervals
+            )
+        return not any(a != b for a, b in _overlapping_pairs(self._intervals))
     
     def get_daily_schedule(self) -> Dict[str, List[tuple[str, TimeSlot]]]:
+        if self._daily_cache is not None:
+            return self._daily_cache
+
         daily_schedule = {day: [] for day in self.days_order}
         
         for course in self.courses:
@@ -77,8 +132,9 @@ class Schedule:
                         daily_schedule[day].append((f"{course.code} (Şube: {course.section})", slot))
         
         for day in daily_schedule:
-            daily_schedule[day].sort(key=lambda x: x[1].start_time)
+            daily_schedule[day].sort(key=lambda x: x[1].start_min)
         
+        self._daily_cache = daily_schedule
         return daily_schedule
     
     def __str__(self):
@@ -95,11 +151,46 @@ class Schedule:
 class CourseScheduler:
     def __init__(self):
         self.all_courses: Dict[str, List[Course]] = {}
+        self._sections: List[Course] = []
+        self._section_ids: Dict[str, List[int]] = {}
+        self._conflicts: List[int] = []
+        self._sorted_codes: Optional[List[str]] = None
     
     def add_course(self, course: Course):
         if course.code not in self.all_courses:
             self.all_courses[course.code] = []
         self.all_courses[course.code].append(course)
+        self._sorted_codes = None
+
+    @property
+    def sorted_codes(self) -> List[str]:
+        if self._sorted_codes is None:
+            self._sorted_codes = sorted(self.all_courses.keys())
+        return self._sorted_codes
+
+    def _build_conflicts(self):
+        self._sections = [course for courses in self.all_courses.values() for course in courses]
+        self._section_ids = {}
+        for i, course in enumerate(self._sections):
+            self._section_ids.setdefault(course.code, []).append(i)
+
+        # Flatten every section's intervals into int rows and sweep them per day,
+        # so conflicts come from one sorted pass instead of pairwise comparisons.
+        rows = sorted(
+            (day, start, end, i)
+            for i, course in enumerate(self._sections)
+            for day, start, end in course.intervals
+        )
+        conflicts = [0] * len(self._sections)
+        for i, course in enumerate(self._sections):
+            # A section with any real slot clashes with itself, so a course code
+            # selected twice as mandatory can't reuse the same section.
+            if any(start < end for _, start, end in course.intervals):
+                conflicts[i] |= 1 << i
+        for i, j in _overlapping_pairs(rows):
+            conflicts[i] |= 1 << j
+            conflicts[j] |= 1 << i
+        self._conflicts = conflicts
     # def list_all_courses(self) -> str:
     #     if not self.all_courses:
     #         return "Henüz eklenmiş ders bulunmamaktadır."
@@ -136,7 +227,7 @@ class CourseScheduler:
 
             time_str, course_with_section, name, classroom, instructor = parts
 
-            match = re.match(r"([A-Z]+ \d+)\((\d+)\)", course_with_section)
+            match = _CODE_RE.match(course_with_section)
             if not match:
                 continue
 
@@ -161,48 +252,77 @@ class CourseScheduler:
                 self.add_course(course)
 
             course.add_time_slot(current_day, time_slot)
-
     
     def get_numbered_course_list(self) -> List[str]:
-        courses = sorted(self.all_courses.keys())
-        return [f"{i+1}. {code}" for i, code in enumerate(courses)]
+        return [f"{i+1}. {code}" for i, code in enumerate(self.sorted_codes)]
     
     def get_course_code_by_number(self, number: int) -> Optional[str]:
-        courses = sorted(self.all_courses.keys())
+        courses = self.sorted_codes
         if 1 <= number <= len(courses):
             return courses[number - 1]
         return None
     
+    def _backtrack(self, section_combinations: List[List[int]], chosen: List[Optional[int]],
+                   forbidden_mask: int, out: List[tuple]):
+        best_level = None
+        best_options = None
+        for level, section_ids in enumerate(section_combinations):
+            if chosen[level] is not None:
+                continue
+            options = [i for i in section_ids if not forbidden_mask & (1 << i)]
+            if best_options is None or len(options) < len(best_options):
+                best_level, best_options = level, options
+                if not options:
+                    return
+
+        if best_level is None:
+            out.append(tuple(chosen))
+            return
+
+        for i in best_options:
+            chosen[best_level] = i
+            self._backtrack(section_combinations, chosen, forbidden_mask | self._conflicts[i], out)
+        chosen[best_level] = None
+    
     def generate_possible_schedules(self, mandatory_courses: List[str]) -> List[Schedule]:
+        # Courses can gain time slots after being added, so the masks are
+        # rebuilt for every search rather than cached across calls.
+        self._build_conflicts()
+
         possible_schedules = []
         section_combinations = []
         
         for course_code in mandatory_courses:
-            if course_code in self.all_courses:
-                section_combinations.append(self.all_courses[course_code])
-        
-        for combination in product(*section_combinations):
-            schedule = Schedule(list(combination))
-            if schedule.is_valid():
-                possible_schedules.append(schedule)
-        
+            if course_code in self._section_ids:
+                section_combinations.append(self._section_ids[course_code])
+
+        assignments = []
+        self._backtrack(section_combinations, [None] * len(section_combinations), 0, assignments)
+        # Keep the order product() over the mandatory courses would produce.
+        assignments.sort()
+        for assignment in assignments:
+            possible_schedules.append(Schedule([self._sections[i] for i in assignment]))
         return possible_schedules
     
     def add_optional_courses(self, schedule: Schedule) -> Schedule:
-        current_courses = set(schedule.courses)
-        current_course_codes = {course.code for course in schedule.courses}
-        selectable_courses = []
+        current_courses = []
+        current_keys = set()
 
-        for courses in self.all_courses.values():
+        def keep(courses: List[Course]):
             for course in courses:
-                if course.code in current_course_codes:
-                    continue
-                selectable_courses.append(course)
+                if (course.code, course.section) not in current_keys:
+                    current_keys.add((course.code, course.section))
+                    current_courses.append(course)
+
+        keep(schedule.courses)
+        current_course_codes = {code for code, _ in current_keys}
+        selectable_courses = [course for courses in self.all_courses.values() for course in courses
+                              if course.code not in current_course_codes]
 
         while True:
             if not selectable_courses:
                 print("\nUygun seçmeli ders bulunamadı!")
-                return Schedule(list(current_courses))
+                return Schedule(current_courses)
 
             print("\nAşağıdaki seçmeli dersler mevcut programa eklenebilir:")
             for i, course in enumerate(selectable_courses, 1):
@@ -212,7 +332,7 @@ class CourseScheduler:
             selection = input("> ").strip().upper()
 
             if selection == 'G':
-                return Schedule(list(current_courses)) 
+                return Schedule(current_courses) 
 
             selected_numbers = [int(num.strip()) for num in selection.split(',') if num.strip().isdigit()]
             selected_courses = [selectable_courses[num - 1] for num in selected_numbers if 1 <= num <= len(selectable_courses)]
@@ -220,7 +340,7 @@ class CourseScheduler:
             valid_courses = []
             conflicted_courses = []
             for course in selected_courses:
-                temp_schedule = Schedule(list(current_courses) + [course])
+                temp_schedule = Schedule(current_courses + [course])
                 if temp_schedule.is_valid():
                     valid_courses.append(course)
                 else:
@@ -234,25 +354,27 @@ class CourseScheduler:
                 print("\nTekrar seçmek ister misiniz? (E/H)")
                 retry = input("> ").strip().upper()
                 if retry == 'H':
-                    return Schedule(list(current_courses))  
+                    return Schedule(current_courses)  
                 else:
-                    selectable_courses = [course for course in selectable_courses if course not in conflicted_courses]
+                    conflicted_keys = {(course.code, course.section) for course in conflicted_courses}
+                    selectable_courses = [course for course in selectable_courses
+                                          if (course.code, course.section) not in conflicted_keys]
             else:
-                current_courses.update(valid_courses)
-                return Schedule(list(current_courses))
+                keep(valid_courses)
+                return Schedule(current_courses)
 
 
 def format_schedule(input_text):
+    SEEKING_DAY, SEEKING_HEADER, READING_FIRST_DAY, READING_SECOND_DAY = range(4)
     standard_header = "Saat	Ders Kodu	Ders Adı	Derslik	Öğretim Elemanı"
     input_text = input_text.replace("Tanımlı Ders Programı Bulunamadı!", standard_header)
     
-    lines = input_text.strip().split('\n')
+    lines = input_text.strip().splitlines()
     
     formatted_output = []
     header = None
-    current_day_classes = []
-    
-    days = ["Pazartesi", "Salı", "Çarşamba", "Perşembe", "Cuma", "Cumartesi", "Pazar"]
+    found_days = []
+    classes = []
     
     def process_day_data(day, header, classes):
         if not day:
@@ -274,55 +396,47 @@ def format_schedule(input_text):
         result.append("")
         return result
     
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        if not line:
-            i += 1
-            continue
-            
-        day_pair = line.split()
-        found_days = []
-        
-        for word in day_pair:
-            if word in days:
-                found_days.append(word)
-        
-        if found_days:
-            if current_day_classes:
-                formatted_output.extend(process_day_data(found_days[0], header, current_day_classes))
-                current_day_classes = []
-            
-            i += 1
-            while i < len(lines) and "Saat" not in lines[i]:
-                i += 1
-            
-            if i < len(lines):
-                header = lines[i]
-                i += 1
-                
-                first_day_classes = []
-                while i < len(lines) and "Saat" not in lines[i]:
-                    if lines[i].strip():
-                        first_day_classes.append(lines[i].strip())
-                    i += 1
-                
-                formatted_output.extend(process_day_data(found_days[0], header, first_day_classes))
-                
-                if i < len(lines) and "Saat" in lines[i]:
-                    header = lines[i]
-                    i += 1
-                    
-                    second_day_classes = []
-                    while i < len(lines) and not any(day in lines[i] for day in days):
-                        if lines[i].strip():
-                            second_day_classes.append(lines[i].strip())
-                        i += 1
-                    if len(found_days) > 1:
-                        formatted_output.extend(process_day_data(found_days[1], header, second_day_classes))
-                continue
-        i += 1
+    # OBS pastes two days side by side: a line naming the days, then one
+    # "Saat" header and class block per day.
+    state = SEEKING_DAY
+    for raw_line in lines:
+        line = raw_line.strip()
+        day_words = [word for word in line.split() if word in DAYS_SET]
+
+        # A new day line closes whichever day block is still open.
+        if state == READING_FIRST_DAY and day_words:
+            formatted_output.extend(process_day_data(found_days[0], header, classes))
+            state = SEEKING_DAY
+        elif state == READING_SECOND_DAY and day_words:
+            if len(found_days) > 1:
+                formatted_output.extend(process_day_data(found_days[1], header, classes))
+            state = SEEKING_DAY
+
+        if state == SEEKING_DAY:
+            found_days = day_words
+            if found_days:
+                state = SEEKING_HEADER
+        elif state == SEEKING_HEADER:
+            if line.startswith("Saat"):
+                header = raw_line
+                classes = []
+                state = READING_FIRST_DAY
+        elif state == READING_FIRST_DAY:
+            if line.startswith("Saat"):
+                formatted_output.extend(process_day_data(found_days[0], header, classes))
+                header = raw_line
+                classes = []
+                state = READING_SECOND_DAY
+            elif line:
+                classes.append(line)
+        elif line:
+            classes.append(line)
+
+    if state == READING_FIRST_DAY:
+        formatted_output.extend(process_day_data(found_days[0], header, classes))
+    elif state == READING_SECOND_DAY and len(found_days) > 1:
+        formatted_output.extend(process_day_data(found_days[1], header, classes))
+
     if formatted_output and not formatted_output[-1]:
         formatted_output.pop()
     return '\n'.join(formatted_output)
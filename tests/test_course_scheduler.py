@@ -0,0 +1,268 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from main import Course, CourseScheduler, Schedule, TimeSlot, format_schedule
+
+HEADER = "Saat\tDers Kodu\tDers Adı\tDerslik\tÖğretim Elemanı"
+
+
+def schedule_keys(schedules):
+    return [[(course.code, course.section) for course in schedule.courses] for schedule in schedules]
+
+
+class TestTimeSlot(unittest.TestCase):
+    def test_minutes_parsed_from_strings(self):
+        slot = TimeSlot("09:30", "10:20")
+        self.assertEqual((slot.start_min, slot.end_min), (570, 620))
+        self.assertEqual(str(slot), "09:30-10:20")
+        self.assertEqual(slot, TimeSlot("09:30", "10:20"))
+
+
+
+class TestCourse(unittest.TestCase):
+    def test_intervals_follow_added_slots(self):
+        course = Course("MAT 101", "Matematik", "1", "A1", "Hoca", {})
+        course.add_time_slot("Salı", TimeSlot("13:00", "14:00"))
+        course.add_time_slot("Pazartesi", TimeSlot("11:00", "12:00"))
+        course.add_time_slot("Pazartesi", TimeSlot("09:00", "10:00"))
+        self.assertEqual(course.intervals, ((0, 540, 600), (0, 660, 720), (1, 780, 840)))
+        self.assertEqual(course.time_slots["Pazartesi"], [TimeSlot("09:00", "10:00"), TimeSlot("11:00", "12:00")])
+
+        course.add_time_slot("Salı", TimeSlot("08:00", "09:00"))
+        self.assertEqual(course.intervals[-2:], ((1, 480, 540), (1, 780, 840)))
+
+
+class TestGeneratePossibleSchedules(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = CourseScheduler()
+        self.scheduler.parse_schedule("\n".join([
+            "Pazartesi",
+            HEADER,
+            "09:00-10:50\tMAT 101(1)\tMatematik\tA1\tHoca",
+            "09:30-10:20\tFIZ 101(1)\tFizik\tB1\tHoca",
+            "11:00-12:50\tFIZ 101(2)\tFizik\tB2\tHoca",
+            "13:00-14:50\tKIM 101(1)\tKimya\tC1\tHoca",
+            "Salı",
+            HEADER,
+            "09:00-10:50\tMAT 101(2)\tMatematik\tA2\tHoca",
+            "10:00-11:50\tKIM 101(2)\tKimya\tC2\tHoca",
+            "13:00-14:50\tFIZ 101(3)\tFizik\tB3\tHoca",
+        ]))
+
+    def test_results_follow_product_order(self):
+        schedules = self.scheduler.generate_possible_schedules(["MAT 101", "FIZ 101", "KIM 101"])
+        self.assertEqual(schedule_keys(schedules), [
+            [("MAT 101", "1"), ("FIZ 101", "2"), ("KIM 101", "1")],
+            [("MAT 101", "1"), ("FIZ 101", "2"), ("KIM 101", "2")],
+            [("MAT 101", "1"), ("FIZ 101", "3"), ("KIM 101", "1")],
+            [("MAT 101", "1"), ("FIZ 101", "3"), ("KIM 101", "2")],
+            [("MAT 101", "2"), ("FIZ 101", "1"), ("KIM 101", "1")],
+            [("MAT 101", "2"), ("FIZ 101", "2"), ("KIM 101", "1")],
+            [("MAT 101", "2"), ("FIZ 101", "3"), ("KIM 101", "1")],
+        ])
+        self.assertTrue(all(schedule.is_valid() for schedule in schedules))
+
+    def test_code_selected_twice_uses_distinct_sections(self):
+        schedules = self.scheduler.generate_possible_schedules(["MAT 101", "MAT 101"])
+        self.assertEqual(schedule_keys(schedules), [
+            [("MAT 101", "1"), ("MAT 101", "2")],
+            [("MAT 101", "2"), ("MAT 101", "1")],
+        ])
+
+    def test_directly_constructed_courses_conflict(self):
+        scheduler = CourseScheduler()
+        math = Course("MAT 101", "Matematik", "1", "A1", "Hoca", {})
+        math.add_time_slot("Pazartesi", TimeSlot("09:00", "10:00"))
+        physics = Course("FIZ 101", "Fizik", "1", "B1", "Hoca", {})
+        physics.add_time_slot("Pazartesi", TimeSlot("09:30", "10:30"))
+        scheduler.add_course(math)
+        scheduler.add_course(physics)
+
+        self.assertFalse(Schedule([math, physics]).is_valid())
+        self.assertEqual(scheduler.generate_possible_schedules(["MAT 101", "FIZ 101"]), [])
+
+    def test_slots_added_after_a_search_are_checked(self):
+        scheduler = CourseScheduler()
+        math = Course("MAT 101", "Matematik", "1", "A1", "Hoca", {})
+        physics = Course("FIZ 101", "Fizik", "1", "B1", "Hoca", {})
+        scheduler.add_course(math)
+        scheduler.add_course(physics)
+        self.assertEqual(len(scheduler.generate_possible_schedules(["MAT 101", "FIZ 101"])), 1)
+
+        math.add_time_slot("Pazartesi", TimeSlot("09:00", "10:00"))
+        physics.add_time_slot("Pazartesi", TimeSlot("09:30", "10:30"))
+        self.assertEqual(scheduler.generate_possible_schedules(["MAT 101", "FIZ 101"]), [])
+
+    def test_slots_under_unknown_label_still_conflict(self):
+        scheduler = CourseScheduler()
+        scheduler.parse_schedule("\n".join([
+            "09:00-10:00\tMAT 101(1)\tA\tr\ti",
+            "09:30-10:30\tFIZ 101(1)\tB\tr\ti",
+            "Pazartesi",
+            "Not",
+            "09:00-10:00\tMAT 101(2)\tA\tr\ti",
+            "09:30-10:30\tFIZ 101(2)\tB\tr\ti",
+        ]))
+        schedules = scheduler.generate_possible_schedules(["MAT 101", "FIZ 101"])
+        self.assertEqual(schedule_keys(schedules), [
+            [("MAT 101", "1"), ("FIZ 101", "2")],
+            [("MAT 101", "2"), ("FIZ 101", "1")],
+        ])
+
+
+
+
+class TestCourseNumbering(unittest.TestCase):
+    def test_sorted_codes_refresh_after_add_course(self):
+        scheduler = CourseScheduler()
+        scheduler.add_course(Course("MAT 101", "Matematik", "1", "A1", "Hoca", {}))
+        self.assertEqual(scheduler.get_numbered_course_list(), ["1. MAT 101"])
+
+        scheduler.add_course(Course("FIZ 101", "Fizik", "1", "B1", "Hoca", {}))
+        self.assertEqual(scheduler.get_numbered_course_list(), ["1. FIZ 101", "2. MAT 101"])
+        self.assertEqual(scheduler.get_course_code_by_number(2), "MAT 101")
+        self.assertIsNone(scheduler.get_course_code_by_number(3))
+
+
+class TestScheduleIsValid(unittest.TestCase):
+    def test_overlapping_slots_within_one_course_are_allowed(self):
+        lab = Course("FIZ 101", "Fizik", "1", "B1", "Hoca", {})
+        lab.add_time_slot("Pazartesi", TimeSlot("09:00", "11:00"))
+        lab.add_time_slot("Pazartesi", TimeSlot("10:00", "12:00"))
+        other = Course("MAT 101", "Matematik", "1", "A1", "Hoca", {})
+        other.add_time_slot("Pazartesi", TimeSlot("12:00", "13:00"))
+        self.assertTrue(Schedule([lab, other]).is_valid())
+
+    def test_overlap_hidden_behind_longer_slot_is_found(self):
+        long_course = Course("MAT 101", "Matematik", "1", "A1", "Hoca", {})
+        long_course.add_time_slot("Salı", TimeSlot("08:00", "12:00"))
+        long_course.add_time_slot("Salı", TimeSlot("09:00", "09:30"))
+        short = Course("KIM 101", "Kimya", "1", "C1", "Hoca", {})
+        short.add_time_slot("Salı", TimeSlot("11:00", "11:30"))
+        self.assertFalse(Schedule([long_course, short]).is_valid())
+
+    def test_adjacent_slots_do_not_conflict(self):
+        first = Course("MAT 101", "Matematik", "1", "A1", "Hoca", {})
+        first.add_time_slot("Cuma", TimeSlot("09:00", "10:00"))
+        second = Course("FIZ 101", "Fizik", "1", "B1", "Hoca", {})
+        second.add_time_slot("Cuma", TimeSlot("10:00", "11:00"))
+        self.assertTrue(Schedule([first, second]).is_valid())
+
+
+
+class TestScheduleDisplay(unittest.TestCase):
+    def test_daily_schedule_is_built_once(self):
+        math = Course("MAT 101", "Matematik", "1", "A1", "Hoca", {})
+        math.add_time_slot("Pazartesi", TimeSlot("11:00", "12:00"))
+        physics = Course("FIZ 101", "Fizik", "2", "B1", "Hoca", {})
+        physics.add_time_slot("Pazartesi", TimeSlot("09:00", "10:00"))
+        schedule = Schedule([math, physics])
+
+        daily = schedule.get_daily_schedule()
+        self.assertIs(schedule.get_daily_schedule(), daily)
+        self.assertEqual(str(schedule), "Pazartesi:\n  FIZ 101 (Şube: 2) 09:00-10:00\n  MAT 101 (Şube: 1) 11:00-12:00")
+
+
+
+class TestAddOptionalCourses(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = CourseScheduler()
+        self.math = Course("MAT 101", "Matematik", "1", "A1", "Hoca", {})
+        self.math.add_time_slot("Pazartesi", TimeSlot("09:00", "10:00"))
+        self.physics = Course("FIZ 101", "Fizik", "1", "B1", "Hoca", {})
+        self.physics.add_time_slot("Salı", TimeSlot("09:00", "10:00"))
+        self.chemistry = Course("KIM 101", "Kimya", "1", "C1", "Hoca", {})
+        self.chemistry.add_time_slot("Pazartesi", TimeSlot("09:30", "10:30"))
+        for course in (self.math, self.physics, self.chemistry):
+            self.scheduler.add_course(course)
+
+    def add_optional(self, schedule, answers):
+        with mock.patch("builtins.input", side_effect=answers), contextlib.redirect_stdout(io.StringIO()):
+            return self.scheduler.add_optional_courses(schedule)
+
+    def test_duplicate_sections_are_kept_once(self):
+        result = self.add_optional(Schedule([self.math, self.math]), ["1,1"])
+        self.assertEqual(schedule_keys([result]), [[("MAT 101", "1"), ("FIZ 101", "1")]])
+
+    def test_conflicting_choice_is_removed_on_retry(self):
+        result = self.add_optional(Schedule([self.math]), ["2", "E", "1"])
+        self.assertEqual(schedule_keys([result]), [[("MAT 101", "1"), ("FIZ 101", "1")]])
+
+
+class TestFormatSchedule(unittest.TestCase):
+    def test_round_trip(self):
+        raw = "\n".join([
+            "Pazartesi Salı",
+            HEADER,
+            "09:00-10:50\tMAT 101(1)\tMatematik\tA1",
+            HEADER,
+            "11:00-12:50\tISL 201(1)\tPazarlama\tB1\tHoca",
+            "Çarşamba Perşembe",
+            "Tanımlı Ders Programı Bulunamadı!",
+            HEADER,
+            "13:00-14:50\tFIZ 101(2)\tFizik\tC1\tHoca",
+        ])
+        formatted = format_schedule(raw)
+        self.assertEqual(formatted, "\n".join([
+            "Pazartesi",
+            HEADER,
+            "09:00-10:50\tMAT 101(1)\tMatematik\tA1\tHenüz Girilmemiştir",
+            "",
+            "Salı",
+            HEADER,
+            "11:00-12:50\tISL 201(1)\tPazarlama\tB1\tHoca",
+            "",
+            "Çarşamba",
+            HEADER,
+            "",
+            "Perşembe",
+            HEADER,
+            "13:00-14:50\tFIZ 101(2)\tFizik\tC1\tHoca",
+        ]))
+
+        scheduler = CourseScheduler()
+        scheduler.parse_schedule(formatted)
+        self.assertEqual(scheduler.sorted_codes, ["FIZ 101", "ISL 201", "MAT 101"])
+        self.assertEqual(scheduler.all_courses["FIZ 101"][0].time_slots["Perşembe"], [TimeSlot("13:00", "14:50")])
+
+    def test_day_lines_close_open_blocks(self):
+        raw = "\n".join([
+            "Pazartesi",
+            HEADER,
+            "09:00-10:50\tMAT 101(1)\tMatematik\tA1\tHoca",
+            "14.10 Salı Çarşamba",
+            HEADER,
+            "11:00-12:50\tFIZ 101(1)\tFizik\tB1\tHoca",
+            HEADER,
+            "13:00-14:50\tKIM 101(1)\tKimya\tC1\tHoca",
+            "Hafta 7 Perşembe",
+            HEADER,
+            "15:00-16:50\tBLM 101(1)\tBilgisayar\tD1\tHoca",
+        ])
+        self.assertEqual(format_schedule(raw), "\n".join([
+            "Pazartesi",
+            HEADER,
+            "09:00-10:50\tMAT 101(1)\tMatematik\tA1\tHoca",
+            "",
+            "Salı",
+            HEADER,
+            "11:00-12:50\tFIZ 101(1)\tFizik\tB1\tHoca",
+            "",
+            "Çarşamba",
+            HEADER,
+            "13:00-14:50\tKIM 101(1)\tKimya\tC1\tHoca",
+            "",
+            "Perşembe",
+            HEADER,
+            "15:00-16:50\tBLM 101(1)\tBilgisayar\tD1\tHoca",
+        ]))
+
+
+if __name__ == "__main__":
+    unittest.main()